@@ -1,16 +1,25 @@
 """
 CSV Data Extractor
-Handles extraction from CSV files with validation and error handling
+Handles extraction from Parquet and CSV files with validation and error handling
 """
 
 import pandas as pd
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 from pathlib import Path
 from typing import Optional, List
 from loguru import logger
 
+# Date columns the transform phase expects as datetime64, per table
+DATE_COLUMNS = {
+    'orders': ['order_date', 'ship_date'],
+    'customers': ['registration_date', 'last_purchase_date'],
+    'products': ['created_at', 'updated_at']
+}
+
 
 class CSVExtractor:
-    """Extract data from CSV files with robust error handling"""
+    """Extract data from Parquet/CSV files with robust error handling"""
     
     def __init__(self, source_path: str):
         """
@@ -25,40 +34,73 @@ class CSVExtractor:
         
         logger.info(f"CSV Extractor initialized with path: {source_path}")
     
-    def extract(self, table_name: str, encoding: str = 'utf-8') -> pd.DataFrame:
+    def extract(self, table_name: str, encoding: str = 'utf-8',
+                columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
-        Extract data from CSV file
-        
+        Extract data from Parquet or CSV file
+
+        Prefers a Parquet file when one exists for the table (columnar,
+        typed and compressed - no date re-parsing needed), falling back
+        to CSV for legacy sources.
+
         Args:
-            table_name: Name of the table (without .csv extension)
-            encoding: File encoding (default: utf-8)
-            
+            table_name: Name of the table (without file extension)
+            encoding: File encoding for CSV files (default: utf-8)
+            columns: Optional subset of columns to read (pushed down to
+                the Parquet/CSV reader so unneeded columns never leave disk)
+
         Returns:
             DataFrame containing extracted data
         """
-        file_path = self.source_path / f"{table_name}.csv"
-        
+        parquet_path = self.source_path / f"{table_name}.parquet"
+        csv_path = self.source_path / f"{table_name}.csv"
+        file_path = parquet_path if parquet_path.exists() else csv_path
+
         if not file_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {file_path}")
-        
+            raise FileNotFoundError(f"Source file not found: {parquet_path} (or {csv_path})")
+
         logger.info(f"Extracting from: {file_path}")
-        
+
         try:
-            # Read CSV with pandas
-            df = pd.read_csv(
-                file_path,
-                encoding=encoding,
-                parse_dates=self._get_date_columns(table_name),
-                na_values=['', 'NULL', 'null', 'N/A', 'NA']
-            )
-            
+            if file_path.suffix == '.parquet':
+                df = pq.read_table(file_path, columns=columns).to_pandas()
+            else:
+                # pyarrow's CSV reader tokenizes on all cores and converts
+                # to pandas zero-copy for numeric columns
+                table = pacsv.read_csv(
+                    file_path,
+                    read_options=pacsv.ReadOptions(
+                        use_threads=True,
+                        block_size=8 << 20,
+                        encoding=encoding
+                    ),
+                    convert_options=pacsv.ConvertOptions(
+                        timestamp_parsers=['%Y-%m-%d', '%Y-%m-%d %H:%M:%S'],
+                        null_values=['', 'NULL', 'null', 'N/A', 'NA'],
+                        strings_can_be_null=True,
+                        include_columns=columns
+                    )
+                )
+                # date_as_object=False keeps date32-inferred columns as
+                # datetime64 rather than object arrays of datetime.date
+                df = table.to_pandas(
+                    self_destruct=True, split_blocks=True, date_as_object=False
+                )
+
+            # Guarantee the dtypes downstream relies on: source files may
+            # still carry date columns as strings (e.g. Parquet written by
+            # older generator runs), so coerce anything non-datetime
+            for col in DATE_COLUMNS.get(table_name, []):
+                if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                    df[col] = pd.to_datetime(df[col], errors='coerce')
+
             # Add extraction metadata
             df['_extracted_at'] = pd.Timestamp.now()
             df['_source_file'] = file_path.name
-            
+
             logger.info(f"Successfully extracted {len(df)} rows from {file_path.name}")
             return df
-            
+
         except Exception as e:
             logger.error(f"Failed to extract from {file_path}: {str(e)}")
             raise
@@ -92,15 +134,6 @@ class CSVExtractor:
         return df
     
     def list_available_files(self) -> List[str]:
-        """List all CSV files in source directory"""
-        csv_files = list(self.source_path.glob('*.csv'))
-        return [f.stem for f in csv_files]
-    
-    def _get_date_columns(self, table_name: str) -> List[str]:
-        """Return list of date columns for specific table"""
-        date_columns_map = {
-            'orders': ['order_date', 'ship_date'],
-            'customers': ['registration_date', 'last_purchase_date'],
-            'products': ['created_at', 'updated_at']
-        }
-        return date_columns_map.get(table_name, [])
+        """List all Parquet/CSV files in source directory"""
+        files = list(self.source_path.glob('*.parquet')) + list(self.source_path.glob('*.csv'))
+        return sorted({f.stem for f in files})
@@ -1,16 +1,59 @@
 import sqlite3
 import pandas as pd
 
+# Arrow-native extraction is optional: fall back to read_sql_query without it
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+except ImportError:
+    adbc_sqlite = None
+
 class DatabaseExtractor:
     def __init__(self, db_path, db_type='sqlite'):
         self.db_path = db_path
         self.db_type = db_type
+        self._adbc_conn = None
+        self._conn = None
+
+    @property
+    def conn(self):
+        # One shared connection, opened lazily: sqlite3.connect pays for
+        # journal init and page cache allocation on every call, so reuse
+        # it across extractions instead of reconnecting per table
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA cache_size = -131072")
+            self._conn.execute("PRAGMA mmap_size = 268435456")
+            self._conn.execute("PRAGMA temp_store = MEMORY")
+        return self._conn
 
     def extract_table(self, table_name):
         if self.db_type != 'sqlite':
             raise ValueError("Only sqlite is supported in this demo project")
 
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
-        conn.close()
-        return df
+        if adbc_sqlite is not None:
+            # Stream the result straight into an Arrow table and convert to
+            # pandas once at the boundary, skipping the per-value Python
+            # objects that read_sql_query materializes
+            if self._adbc_conn is None:
+                self._adbc_conn = adbc_sqlite.connect(str(self.db_path))
+            with self._adbc_conn.cursor() as cursor:
+                cursor.execute(f"SELECT * FROM {table_name}")
+                return cursor.fetch_arrow_table().to_pandas()
+
+        return pd.read_sql_query(f"SELECT * FROM {table_name}", self.conn)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._adbc_conn is not None:
+            self._adbc_conn.close()
+            self._adbc_conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
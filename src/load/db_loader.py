@@ -1,6 +1,22 @@
+import io
+import queue
+import threading
+
 import sqlalchemy
 import pandas as pd
 
+# Streaming load settings: chunk rows so peak memory stays bounded, with a
+# short queue so serialization overlaps the network write
+BATCH_ROWS = 100_000
+QUEUE_DEPTH = 4
+
+# Arrow-native ingest is optional: fall back to COPY when the driver is missing
+try:
+    import pyarrow as pa
+    import adbc_driver_postgresql.dbapi as adbc_postgresql
+except ImportError:
+    adbc_postgresql = None
+
 class DatabaseLoader:
     def __init__(self, config):
         user = config["user"]
@@ -9,14 +25,144 @@ class DatabaseLoader:
         port = config["port"]
         db = config["database"]
 
-        self.engine = sqlalchemy.create_engine(
-            f"postgresql://{user}:{password}@{host}:{port}/{db}"
-        )
+        self._uri = f"postgresql://{user}:{password}@{host}:{port}/{db}"
+        self.engine = sqlalchemy.create_engine(self._uri)
 
-    def load_full(self, df, table_name):
-        df.to_sql(table_name, self.engine, if_exists="replace", index=False)
-        return len(df)
+    def load_full(self, df, table_name, indexes=None):
+        # Capture secondary-index DDL before the table is replaced, and
+        # recreate the indexes only after the data is in: loading into an
+        # indexed table pays a btree update per row, one CREATE INDEX at
+        # the end builds each index in a single pass instead
+        if indexes is None:
+            indexes = self._get_index_ddl(table_name)
+
+        if adbc_postgresql is not None:
+            count = self.load_arrow(df, table_name, mode="replace")
+        else:
+            # Recreate the table schema with an empty to_sql, then bulk COPY
+            df.head(0).to_sql(table_name, self.engine, if_exists="replace", index=False)
+            self._copy_from(df, table_name)
+            count = len(df)
+
+        self._create_indexes(indexes)
+        return count
 
     def load_incremental(self, df, table_name):
-        df.to_sql(table_name, self.engine, if_exists="append", index=False)
+        if adbc_postgresql is not None:
+            return self.load_arrow(df, table_name, mode="create_append")
+        # Make sure the table exists, then append via COPY
+        df.head(0).to_sql(table_name, self.engine, if_exists="append", index=False)
+        self._copy_from(df, table_name)
+        return len(df)
+
+    def load_arrow(self, df, table_name, mode):
+        # Batches are sent in Postgres' binary columnar format with no
+        # per-value Python conversion, unlike the to_sql/CSV paths. The
+        # table is sliced into RecordBatches behind a bounded queue so
+        # slicing overlaps the network write and memory stays bounded.
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        if table.num_rows == 0:
+            # An empty frame yields zero batches, which would skip the
+            # ingest entirely and leave the old table (and its stale rows)
+            # in place; ingest the empty table so replace still replaces
+            with adbc_postgresql.connect(self._uri) as conn:
+                with conn.cursor() as cursor:
+                    cursor.adbc_ingest(table_name, table, mode=mode)
+                conn.commit()
+            return 0
+
+        batches = queue.Queue(maxsize=QUEUE_DEPTH)
+
+        def produce():
+            try:
+                for batch in table.to_batches(max_chunksize=BATCH_ROWS):
+                    batches.put(batch)
+            finally:
+                batches.put(None)  # sentinel: no more batches
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            with adbc_postgresql.connect(self._uri) as conn:
+                with conn.cursor() as cursor:
+                    # First batch creates/replaces the table, the rest append
+                    batch_mode = mode
+                    while True:
+                        batch = batches.get()
+                        if batch is None:
+                            break
+                        cursor.adbc_ingest(table_name, batch, mode=batch_mode)
+                        batch_mode = "append"
+                conn.commit()
+        finally:
+            while producer.is_alive():
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            producer.join()
         return len(df)
+
+    def _get_index_ddl(self, table_name):
+        # DDL of the table's secondary indexes (the PK travels with the
+        # table definition itself and is skipped)
+        query = sqlalchemy.text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = 'public' AND tablename = :table "
+            "AND indexname NOT LIKE '%_pkey'"
+        )
+        with self.engine.connect() as conn:
+            return [row[0] for row in conn.execute(query, {"table": table_name})]
+
+    def _create_indexes(self, index_ddl):
+        if not index_ddl:
+            return
+        with self.engine.begin() as conn:
+            for ddl in index_ddl:
+                conn.execute(sqlalchemy.text(ddl))
+
+    def _copy_from(self, df, table_name):
+        # COPY FROM STDIN streams chunks instead of the per-row INSERTs
+        # that to_sql issues; a producer thread serializes the next chunk
+        # while the previous one is on the wire
+        columns = ", ".join(f'"{col}"' for col in df.columns)
+        copy_sql = f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)'
+
+        chunks = queue.Queue(maxsize=QUEUE_DEPTH)
+
+        def produce():
+            try:
+                for start in range(0, len(df), BATCH_ROWS):
+                    buf = io.StringIO()
+                    df.iloc[start:start + BATCH_ROWS].to_csv(buf, index=False, header=False)
+                    buf.seek(0)
+                    chunks.put(buf)
+            finally:
+                chunks.put(None)  # sentinel: no more chunks
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            while True:
+                buf = chunks.get()
+                if buf is None:
+                    break
+                cursor.copy_expert(copy_sql, buf)
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            # Drain so a blocked producer can finish before we join it
+            while producer.is_alive():
+                try:
+                    chunks.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            producer.join()
+            raw.close()
@@ -5,12 +5,24 @@ Main entry point for the ETL data migration pipeline
 
 import sys
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import yaml
 from loguru import logger
 
+# numexpr fuses arithmetic into one loop with no operator temporaries;
+# fall back to plain NumPy expressions when it isn't installed
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -23,6 +35,20 @@ from src.load.db_loader import DatabaseLoader
 from src.utils.metrics import PipelineMetrics
 from src.utils.error_handler import ErrorHandler
 
+# libyaml's C loader is 5-10x faster than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Loguru handlers are process-global; only install them once so repeated
+# orchestrator construction doesn't stack duplicate sinks
+_LOGGING_INITIALIZED = False
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file, cached per path for repeat constructions"""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 class ETLOrchestrator:
     """
@@ -40,12 +66,16 @@ class ETLOrchestrator:
         logger.info("ETL Orchestrator initialized")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    
+        """Load configuration from YAML file (cached per path)"""
+        return _load_yaml(config_path)
+
     def _setup_logging(self):
-        """Configure logging with rotation and format"""
+        """Configure logging with rotation and format (idempotent)"""
+        global _LOGGING_INITIALIZED
+        if _LOGGING_INITIALIZED:
+            return
+        _LOGGING_INITIALIZED = True
+
         log_config = self.config.get('monitoring', {})
         log_level = log_config.get('log_level', 'INFO')
         log_path = log_config.get('log_path', 'logs/etl_pipeline.log')
@@ -164,39 +194,44 @@ class ETLOrchestrator:
             Dictionary of extracted dataframes by source
         """
         extracted_data = {}
-        
-        # Extract from CSV files
+
+        # Build one task per source; CSV/Parquet files and the SQLite
+        # table are independent and I/O-bound, so extract them concurrently
         csv_extractor = CSVExtractor(self.config['source']['csv_path'])
         csv_tables = [table] if table else ['orders', 'customers']
-        
-        for csv_table in csv_tables:
-            logger.info(f"Extracting from CSV: {csv_table}")
-            try:
-                df = csv_extractor.extract(csv_table)
-                extracted_data[csv_table] = df
-                logger.info(f"Extracted {len(df)} records from {csv_table}")
-                self.metrics.record_extraction(csv_table, len(df))
-            except Exception as e:
-                logger.error(f"Failed to extract {csv_table}: {str(e)}")
-                self.error_handler.handle_error(e, context={"table": csv_table})
-        
-        # Extract from SQLite database
+
+        tasks = [
+            (csv_table, lambda t=csv_table: csv_extractor.extract(t))
+            for csv_table in csv_tables
+        ]
+
+        db_extractor = None
         if table is None or table == 'products':
             db_extractor = DatabaseExtractor(
                 self.config['source']['sqlite_db'],
                 db_type='sqlite'
             )
-            
-            logger.info("Extracting from SQLite: products")
-            try:
-                df = db_extractor.extract_table('products')
-                extracted_data['products'] = df
-                logger.info(f"Extracted {len(df)} records from products")
-                self.metrics.record_extraction('products', len(df))
-            except Exception as e:
-                logger.error(f"Failed to extract products: {str(e)}")
-                self.error_handler.handle_error(e, context={"table": "products"})
-        
+            tasks.append(('products', lambda: db_extractor.extract_table('products')))
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {name: executor.submit(fn) for name, fn in tasks}
+                for name, future in futures.items():
+                    logger.info(f"Extracting: {name}")
+                    try:
+                        df = future.result()
+                        extracted_data[name] = df
+                        logger.info(f"Extracted {len(df)} records from {name}")
+                        self.metrics.record_extraction(name, len(df))
+                    except Exception as e:
+                        logger.error(f"Failed to extract {name}: {str(e)}")
+                        self.error_handler.handle_error(e, context={"table": name})
+        finally:
+            # The extractor caches its sqlite/ADBC connections; release
+            # them once all futures have resolved
+            if db_extractor is not None:
+                db_extractor.close()
+
         return extracted_data
     
     def _extract_incremental(self, table: str):
@@ -217,48 +252,61 @@ class ETLOrchestrator:
             Dictionary of transformed dataframes
         """
         transformed_data = {}
-        
+
         cleaner = DataCleaner()
         validator = DataValidator(self.config.get('quality', {}))
-        
-        for table_name, df in extracted_data.items():
-            logger.info(f"Transforming: {table_name}")
-            
-            try:
-                # Step 1: Data Cleansing
-                logger.info(f"  - Cleansing {table_name}")
-                df_clean = cleaner.clean(df, table_name)
-                
-                # Step 2: Data Validation
-                logger.info(f"  - Validating {table_name}")
-                validation_result = validator.validate(df_clean, table_name)
-                
-                if not validation_result['is_valid']:
-                    logger.warning(f"Validation warnings for {table_name}:")
-                    for warning in validation_result['warnings']:
-                        logger.warning(f"    - {warning}")
-                
-                # Step 3: Business Logic Transformations
-                logger.info(f"  - Applying business logic to {table_name}")
-                df_transformed = self._apply_business_logic(df_clean, table_name)
-                
-                transformed_data[table_name] = df_transformed
-                logger.success(f"Transformed {len(df_transformed)} records for {table_name}")
-                
-                # Record metrics
-                self.metrics.record_transformation(
-                    table_name,
-                    input_count=len(df),
-                    output_count=len(df_transformed),
-                    quality_score=validation_result.get('quality_score', 100)
+
+        # Per-table transforms don't depend on each other either
+        with ThreadPoolExecutor(max_workers=max(1, len(extracted_data))) as executor:
+            futures = {
+                table_name: executor.submit(
+                    self._transform_table, cleaner, validator, table_name, df
                 )
-                
-            except Exception as e:
-                logger.error(f"Transformation failed for {table_name}: {str(e)}")
-                self.error_handler.handle_error(e, context={"table": table_name, "phase": "transform"})
-                raise
-        
+                for table_name, df in extracted_data.items()
+            }
+            for table_name, future in futures.items():
+                try:
+                    transformed_data[table_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Transformation failed for {table_name}: {str(e)}")
+                    self.error_handler.handle_error(e, context={"table": table_name, "phase": "transform"})
+                    raise
+
         return transformed_data
+
+    def _transform_table(self, cleaner, validator, table_name: str, df):
+        """Cleanse, transform and validate a single table in one pass"""
+        logger.info(f"Transforming: {table_name}")
+
+        # Cleansing and business logic run back-to-back on a single
+        # materialized frame (the cleaner no longer takes a full copy and
+        # the business logic mutates in place), then validation reduces
+        # over the finished columns while they are still cache-warm -
+        # one traversal of each table instead of three
+        logger.info(f"  - Cleansing and transforming {table_name}")
+        df_transformed = self._apply_business_logic(
+            cleaner.clean(df, table_name), table_name
+        )
+
+        logger.info(f"  - Validating {table_name}")
+        validation_result = validator.validate(df_transformed, table_name)
+
+        if not validation_result['is_valid']:
+            logger.warning(f"Validation warnings for {table_name}:")
+            for warning in validation_result['warnings']:
+                logger.warning(f"    - {warning}")
+
+        logger.success(f"Transformed {len(df_transformed)} records for {table_name}")
+
+        # Record metrics
+        self.metrics.record_transformation(
+            table_name,
+            input_count=len(df),
+            output_count=len(df_transformed),
+            quality_score=validation_result.get('quality_score', 100)
+        )
+
+        return df_transformed
     
     def _apply_business_logic(self, df, table_name: str):
         """Apply table-specific business logic transformations"""
@@ -266,25 +314,52 @@ class ETLOrchestrator:
         if table_name == 'orders':
             # Calculate order totals, apply discounts, etc.
             if 'quantity' in df.columns and 'unit_price' in df.columns:
-                df['total_amount'] = df['quantity'] * df['unit_price']
-            
-            # Add derived fields
-            df['order_year'] = df['order_date'].dt.year
-            df['order_month'] = df['order_date'].dt.month
-            
+                quantity = df['quantity'].to_numpy()
+                unit_price = df['unit_price'].to_numpy()
+                if ne is not None:
+                    df['total_amount'] = ne.evaluate("quantity * unit_price")
+                else:
+                    df['total_amount'] = quantity * unit_price
+
+            # Derived fields computed on the raw datetime64 array,
+            # skipping the per-element .dt accessor machinery
+            order_dates = df['order_date'].to_numpy()
+            months = order_dates.astype('datetime64[M]').astype(np.int64)
+            order_year = months // 12 + 1970
+            order_month = months % 12 + 1
+            # NaT casts to INT64_MIN, so the mask works off the converted
+            # array even when the source column wasn't datetime64 (where
+            # np.isnat on the raw values would raise)
+            nat_mask = months == np.iinfo(np.int64).min
+            if nat_mask.any():
+                order_year = np.where(nat_mask, np.nan, order_year)
+                order_month = np.where(nat_mask, np.nan, order_month)
+            df['order_year'] = order_year
+            df['order_month'] = order_month
+
         elif table_name == 'customers':
             # Standardize customer data
             if 'email' in df.columns:
-                df['email'] = df['email'].str.lower().str.strip()
-            
+                # Arrow kernels run over the UTF-8 buffer in C; the chained
+                # .str.lower().str.strip() made two passes, each allocating
+                # a full Series of Python strings
+                arr = pa.array(df['email'], from_pandas=True)
+                df['email'] = pc.utf8_trim_whitespace(pc.utf8_lower(arr)).to_pandas()
+
             # Create customer segments
             # (Would typically join with orders for RFM analysis)
-            
+
         elif table_name == 'products':
             # Categorize products, calculate margins, etc.
             if 'price' in df.columns and 'cost' in df.columns:
-                df['margin_pct'] = ((df['price'] - df['cost']) / df['price'] * 100).round(2)
-        
+                price = df['price'].to_numpy()
+                cost = df['cost'].to_numpy()
+                if ne is not None:
+                    margin_pct = ne.evaluate("(price - cost) / price * 100")
+                else:
+                    margin_pct = (price - cost) / price * 100
+                df['margin_pct'] = np.round(margin_pct, 2)
+
         return df
     
     def _load_phase(self, transformed_data: Dict[str, Any], mode: str = "full"):
@@ -296,25 +371,33 @@ class ETLOrchestrator:
             mode: 'full' or 'incremental'
         """
         loader = DatabaseLoader(self.config['target'])
-        
-        for table_name, df in transformed_data.items():
-            logger.info(f"Loading: {table_name} ({mode} mode)")
-            
-            try:
-                if mode == "full":
-                    # Truncate and reload
-                    records_loaded = loader.load_full(df, table_name)
-                else:
-                    # Upsert (insert/update)
-                    records_loaded = loader.load_incremental(df, table_name)
-                
-                logger.success(f"Loaded {records_loaded} records to {table_name}")
-                self.metrics.record_load(table_name, records_loaded)
-                
-            except Exception as e:
-                logger.error(f"Load failed for {table_name}: {str(e)}")
-                self.error_handler.handle_error(e, context={"table": table_name, "phase": "load"})
-                raise
+
+        # Each table loads to its own target table, so load them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, len(transformed_data))) as executor:
+            futures = {
+                table_name: executor.submit(self._load_table, loader, table_name, df, mode)
+                for table_name, df in transformed_data.items()
+            }
+            for table_name, future in futures.items():
+                try:
+                    records_loaded = future.result()
+                    logger.success(f"Loaded {records_loaded} records to {table_name}")
+                    self.metrics.record_load(table_name, records_loaded)
+                except Exception as e:
+                    logger.error(f"Load failed for {table_name}: {str(e)}")
+                    self.error_handler.handle_error(e, context={"table": table_name, "phase": "load"})
+                    raise
+
+    def _load_table(self, loader, table_name: str, df, mode: str) -> int:
+        """Load a single table in full or incremental mode"""
+        logger.info(f"Loading: {table_name} ({mode} mode)")
+
+        if mode == "full":
+            # Truncate and reload
+            return loader.load_full(df, table_name)
+
+        # Upsert (insert/update)
+        return loader.load_incremental(df, table_name)
     
     def _print_summary(self, run_id: str):
         """Print pipeline execution summary"""
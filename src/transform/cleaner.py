@@ -1,6 +1,5 @@
 class DataCleaner:
     def clean(self, df, table_name):
-        # Very basic cleaning for demo
-        df = df.copy()
-        df = df.dropna(how='all')
-        return df
+        # Very basic cleaning for demo; dropna already returns a new
+        # frame, so no up-front full copy is needed
+        return df.dropna(how='all')
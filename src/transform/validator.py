@@ -1,7 +1,47 @@
+import re
+
+# Field-format patterns, compiled once at import time so validation never
+# pays per-call (let alone per-row) compilation. A batch DFA engine like
+# Hyperscan/RE2 could scan the whole column buffer in one call, but these
+# anchored patterns don't backtrack and precompiled re keeps the stack
+# dependency-free.
+_FIELD_PATTERNS = {
+    'email': re.compile(r'^[^@]+@[^@]+\.[^@]+$'),
+    'phone': re.compile(r'^\+1-\d{3}-\d{3}-\d{4}$'),
+}
+
 class DataValidator:
     def __init__(self, config=None):
         self.config = config or {}
 
     def validate(self, df, table_name):
-        # Always valid for demo purposes
-        return {"is_valid": True, "warnings": [], "quality_score": 100}
+        warnings = []
+        total_checked = 0
+        total_failed = 0
+
+        for column, pattern in _FIELD_PATTERNS.items():
+            if column not in df.columns:
+                continue
+            values = df[column].dropna()
+            if values.empty:
+                continue
+            # One vectorized pass with the precompiled pattern
+            invalid = int((~values.astype(str).str.fullmatch(pattern)).sum())
+            total_checked += len(values)
+            total_failed += invalid
+            if invalid:
+                warnings.append(
+                    f"{invalid} invalid {column} value(s) in {table_name}"
+                )
+
+        if total_checked:
+            quality_score = round(100 * (1 - total_failed / total_checked), 2)
+        else:
+            quality_score = 100
+
+        min_score = self.config.get('min_quality_score', 0.0)
+        return {
+            "is_valid": quality_score >= min_score,
+            "warnings": warnings,
+            "quality_score": quality_score,
+        }